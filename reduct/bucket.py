@@ -1,9 +1,8 @@
 """Bucket module for ReductStore HTTP API"""
 
 import asyncio
-import json
 import time
-from contextlib import asynccontextmanager
+from contextlib import AsyncExitStack, asynccontextmanager, contextmanager
 from datetime import datetime
 from typing import (
     Optional,
@@ -12,8 +11,11 @@ from typing import (
     Union,
     Dict,
     Tuple,
+    Set,
 )
 
+from aiohttp import ClientResponse
+
 from reduct.error import ReductError
 from reduct.http import HttpClient
 from reduct.msg.bucket import (
@@ -23,6 +25,8 @@ from reduct.msg.bucket import (
     BucketFullInfo,
     QueryEntry,
     QueryType,
+    QueryInfo,
+    RemoveQueryInfo,
 )
 from reduct.record import (
     Record,
@@ -34,23 +38,57 @@ from reduct.record import (
 )
 from reduct.time import unix_timestamp_from_any
 
+_ERROR_PREFIX_LEN = len(ERROR_PREFIX)
+_MAX_JOINED_BATCH_SIZE = 1_000_000
+_MIN_POLL_INTERVAL = 0.01
+_FULL_INFO_TTL = 1.0
+# batched responses carry many records, so read them with a bigger buffer
+# than the aiohttp default of 64 KiB
+_BATCH_READ_BUFSIZE = 1024 * 1024
+
 
-class Bucket:
+class Bucket:  # pylint: disable=too-many-public-methods
     """A bucket of data in Reduct Storage"""
 
+    __slots__ = ("_http", "_name", "_path", "_full_info", "_generation", "_wakeups")
+
     def __init__(self, name: str, http: HttpClient):
         self._http = http
-        self.name = name
-
-    async def get_settings(self) -> BucketSettings:
+        self._name = name
+        self._path = f"/b/{name}"
+        # raw response body, parsed on every call to give out fresh models
+        self._full_info: Optional[Tuple[float, bytes]] = None
+        # counts changes to drop responses requested before a change
+        self._generation = 0
+        # one event per running subscription to wake them up independently
+        self._wakeups: Set[asyncio.Event] = set()
+
+    @property
+    def name(self) -> str:
+        """Name of bucket"""
+        return self._name
+
+    @name.setter
+    def name(self, name: str):
+        # the path prefix is built once, not in every request
+        self._name = name
+        self._path = f"/b/{name}"
+        self._reset_full_info()
+
+    async def get_settings(self, force: bool = False) -> BucketSettings:
         """
         Get current bucket settings
+        The settings are cached for 1 second and reset by changes
+        made through this object.
+
+        Args:
+            force: if True: ignore the cache and request the settings
         Returns:
              BucketSettings: the bucket settings
         Raises:
             ReductError: if there is an HTTP error
         """
-        return (await self.get_full_info()).settings
+        return (await self.get_full_info(force)).settings
 
     async def set_settings(self, settings: BucketSettings):
         """
@@ -60,27 +98,40 @@ class Bucket:
         Raises:
             ReductError: if there is an HTTP error
         """
-        await self._http.request_all("PUT", f"/b/{self.name}", data=settings.json())
+        with self._changing():
+            await self._http.request_all(
+                "PUT", self._path, data=settings.model_dump_json()
+            )
 
-    async def info(self) -> BucketInfo:
+    async def info(self, force: bool = False) -> BucketInfo:
         """
         Get statistics about bucket
+        The statistics are cached for 1 second and reset by changes
+        made through this object.
+
+        Args:
+            force: if True: ignore the cache and request the statistics
         Returns:
            BucketInfo: the bucket information
         Raises:
             ReductError: if there is an HTTP error
         """
-        return (await self.get_full_info()).info
+        return (await self.get_full_info(force)).info
 
-    async def get_entry_list(self) -> List[EntryInfo]:
+    async def get_entry_list(self, force: bool = False) -> List[EntryInfo]:
         """
         Get list of entries with their stats
+        The list is cached for 1 second and reset by changes
+        made through this object.
+
+        Args:
+            force: if True: ignore the cache and request the list
         Returns:
             List[EntryInfo]: the list of entries with stats
         Raises:
             ReductError: if there is an HTTP error
         """
-        return (await self.get_full_info()).entries
+        return (await self.get_full_info(force)).entries
 
     async def remove(self):
         """
@@ -88,7 +139,8 @@ class Bucket:
         Raises:
             ReductError: if there is an HTTP error
         """
-        await self._http.request_all("DELETE", f"/b/{self.name}")
+        with self._changing():
+            await self._http.request_all("DELETE", self._path)
 
     async def remove_entry(self, entry_name: str):
         """
@@ -98,7 +150,8 @@ class Bucket:
         Raises:
             ReductError: if there is an HTTP error
         """
-        await self._http.request_all("DELETE", f"/b/{self.name}/{entry_name}")
+        with self._changing():
+            await self._http.request_all("DELETE", f"{self._path}/{entry_name}")
 
     async def remove_record(
         self, entry_name: str, timestamp: Union[int, datetime, float, str]
@@ -112,9 +165,10 @@ class Bucket:
             ReductError: if there is an HTTP error
         """
         timestamp = unix_timestamp_from_any(timestamp)
-        await self._http.request_all(
-            "DELETE", f"/b/{self.name}/{entry_name}?ts={timestamp}"
-        )
+        with self._changing():
+            await self._http.request_all(
+                "DELETE", f"{self._path}/{entry_name}?ts={timestamp}"
+            )
 
     async def remove_batch(
         self, entry_name: str, batch: Batch
@@ -130,14 +184,7 @@ class Bucket:
         Raises:
             ReductError: if there is an HTTP error
         """
-        _, record_headers = self._make_headers(batch)
-        _, headers = await self._http.request_all(
-            "DELETE",
-            f"/b/{self.name}/{entry_name}/batch",
-            extra_headers=record_headers,
-        )
-
-        return self._parse_errors_from_headers(headers)
+        return await self._batch_request("DELETE", entry_name, batch)
 
     async def remove_query(
         self,
@@ -170,31 +217,31 @@ class Bucket:
         Returns:
             number of removed records
         """
-        if (
-            self._http.api_version
-            and self._http.api_version[0] == 1
-            and self._http.api_version[1] >= 13
-        ):
-            start = unix_timestamp_from_any(start) if start else None
-            stop = unix_timestamp_from_any(stop) if stop else None
-
-            query_message = QueryEntry(
-                query_type=QueryType.REMOVE, start=start, stop=stop, when=when, **kwargs
-            )
-            data = query_message.model_dump_json()
-            url = f"/b/{self.name}/{entry_name}/q"
-            resp, _ = await self._http.request_all(
-                "POST",
-                url,
-                data=data,
-            )
-        else:
-            params = await self._parse_query_params(kwargs, start, stop)
-            resp, _ = await self._http.request_all(
-                "DELETE", f"/b/{self.name}/{entry_name}/q", params=params
-            )
-
-        return json.loads(resp)["removed_records"]
+        with self._changing():
+            if self._http.supports_query_post:
+                start = unix_timestamp_from_any(start) if start else None
+                stop = unix_timestamp_from_any(stop) if stop else None
+
+                query_message = QueryEntry(
+                    query_type=QueryType.REMOVE,
+                    start=start,
+                    stop=stop,
+                    when=when,
+                    **kwargs,
+                )
+                data = query_message.model_dump_json()
+                url = f"{self._path}/{entry_name}/q"
+                resp, _ = await self._http.request_all(
+                    "POST",
+                    url,
+                    data=data,
+                )
+            else:
+                params = self._parse_query_params(kwargs, start, stop)
+                resp, _ = await self._http.request_all(
+                    "DELETE", f"{self._path}/{entry_name}/q", params=params
+                )
+        return RemoveQueryInfo.model_validate_json(resp).removed_records
 
     async def rename_entry(self, old_name: str, new_name: str):
         """
@@ -205,9 +252,10 @@ class Bucket:
         Raises:
             ReductError: if there is an HTTP error
         """
-        await self._http.request_all(
-            "PUT", f"/b/{self.name}/{old_name}/rename", json={"new_name": new_name}
-        )
+        with self._changing():
+            await self._http.request_all(
+                "PUT", f"{self._path}/{old_name}/rename", json={"new_name": new_name}
+            )
 
     async def rename(self, new_name: str):
         """
@@ -218,7 +266,7 @@ class Bucket:
             ReductError: if there is an HTTP error
         """
         await self._http.request_all(
-            "PUT", f"/b/{self.name}/rename", json={"new_name": new_name}
+            "PUT", f"{self._path}/rename", json={"new_name": new_name}
         )
         self.name = new_name
 
@@ -246,17 +294,17 @@ class Bucket:
             >>>     async with bucket.read("entry", timestamp=123456789) as record:
             >>>         data = await record.read_all()
         """
-        params = {"ts": unix_timestamp_from_any(timestamp)} if timestamp else None
+        url = f"{self._path}/{entry_name}"
+        if timestamp is not None:
+            url += f"?ts={unix_timestamp_from_any(timestamp)}"
         method = "HEAD" if head else "GET"
-        async with self._http.request(
-            method, f"/b/{self.name}/{entry_name}", params=params
-        ) as resp:
+        async with self._http.request(method, url) as resp:
             yield parse_record(resp)
 
     async def write(
         self,
         entry_name: str,
-        data: Union[bytes, AsyncIterator[bytes]],
+        data: Union[bytes, bytearray, memoryview, AsyncIterator[bytes]],
         timestamp: Optional[Union[int, datetime, float, str]] = None,
         content_length: Optional[int] = None,
         **kwargs,
@@ -266,7 +314,8 @@ class Bucket:
 
         Args:
             entry_name: name of entry in the bucket
-            data: bytes to write or async iterator
+            data: bytes-like object (bytes, bytearray, C-contiguous memoryview)
+                to write or async iterator
             timestamp: timestamp of record. int (UNIX timestamp in microseconds),
                 datetime, float (UNIX timestamp in seconds), str (ISO 8601 string).
                 If None: current time
@@ -277,6 +326,8 @@ class Bucket:
             content_type (str): content type of data
         Raises:
             ReductError: if there is an HTTP error
+            ValueError: if the data is an iterator and content_length is not set
+                or the data is a memoryview that isn't C-contiguous
 
         Examples:
             >>> await bucket.write("entry-1", b"some_data",
@@ -291,18 +342,29 @@ class Bucket:
             >>> await bucket.write("entry-1", sender(), content_length=15)
 
         """
-        timestamp = unix_timestamp_from_any(
-            timestamp if timestamp is not None else int(time.time_ns() / 1000)
-        )
-        params = {"ts": timestamp}
-        await self._http.request_all(
-            "POST",
-            f"/b/{self.name}/{entry_name}",
-            params=params,
-            data=data,
-            content_length=content_length if content_length is not None else len(data),
-            **kwargs,
-        )
+        if timestamp is None:
+            timestamp = time.time_ns() // 1000
+        else:
+            timestamp = unix_timestamp_from_any(timestamp)
+
+        if isinstance(data, memoryview):
+            if not data.c_contiguous:
+                raise ValueError("memoryview must be C-contiguous to write it")
+            # send the memory as it is, but count its size in bytes
+            data = data.cast("B")
+        if content_length is None:
+            if not isinstance(data, (bytes, bytearray, memoryview)):
+                raise ValueError("content_length is required to write an iterator")
+            content_length = len(data)
+
+        with self._changing():
+            await self._http.request_all(
+                "POST",
+                f"{self._path}/{entry_name}?ts={timestamp}",
+                data=data,
+                content_length=content_length,
+                **kwargs,
+            )
 
     async def write_batch(
         self, entry_name: str, batch: Batch
@@ -320,20 +382,16 @@ class Bucket:
             ReductError: if there is an HTTP  or communication error
         """
 
+        if batch.size <= _MAX_JOINED_BATCH_SIZE:
+            # small batches are sent in one write instead of one write per record
+            body = b"".join([await rec.read_all() for _, rec in batch.items()])
+            return await self._batch_request("POST", entry_name, batch, body)
+
         async def iter_body():
             for _, rec in batch.items():
                 yield await rec.read_all()
 
-        content_length, record_headers = self._make_headers(batch)
-        _, headers = await self._http.request_all(
-            "POST",
-            f"/b/{self.name}/{entry_name}/batch",
-            data=iter_body(),
-            extra_headers=record_headers,
-            content_length=content_length,
-        )
-
-        return self._parse_errors_from_headers(headers)
+        return await self._batch_request("POST", entry_name, batch, iter_body())
 
     async def update(
         self,
@@ -358,9 +416,10 @@ class Bucket:
 
         """
         timestamp = unix_timestamp_from_any(timestamp)
-        await self._http.request_all(
-            "PATCH", f"/b/{self.name}/{entry_name}?ts={timestamp}", labels=labels
-        )
+        with self._changing():
+            await self._http.request_all(
+                "PATCH", f"{self._path}/{entry_name}?ts={timestamp}", labels=labels
+            )
 
     async def update_batch(
         self, entry_name: str, batch: Batch
@@ -384,18 +443,9 @@ class Bucket:
             >>> await bucket.update_batch("entry-1", batch)
 
         """
+        return await self._batch_request("PATCH", entry_name, batch)
 
-        content_length, record_headers = self._make_headers(batch)
-        _, headers = await self._http.request_all(
-            "PATCH",
-            f"/b/{self.name}/{entry_name}/batch",
-            extra_headers=record_headers,
-            content_length=content_length,
-        )
-
-        return self._parse_errors_from_headers(headers)
-
-    async def query(  # pylint: disable=too-many-arguments, too-many-positional-arguments
+    async def query(  # pylint: disable=too-many-arguments, too-many-positional-arguments, too-many-locals
         self,
         entry_name: str,
         start: Optional[Union[int, datetime, float, str]] = None,
@@ -431,47 +481,85 @@ class Bucket:
              AsyncIterator[Record]: iterator to the records
 
         Examples:
-            >>> async for record in bucket.query("entry-1", stop=time.time_ns() / 1000):
+            >>> stop = time.time_ns() // 1000
+            >>> async for record in bucket.query("entry-1", stop=stop):
             >>>     data: bytes = record.read_all()
             >>>     # or
-            >>>     async for chunk in record.read(n=1024):
+            >>>     async for chunk in record.read():
             >>>         print(chunk)
         """
-
-        if (
-            self._http.api_version
-            and self._http.api_version[0] == 1
-            and self._http.api_version[1] >= 13
-        ):
+        method = "HEAD" if kwargs.pop("head", False) else "GET"
+        if self._http.supports_query_post:
             query_id = await self._query_post(
                 entry_name, QueryType.QUERY, start, stop, when, ttl, **kwargs
             )
         else:
             query_id = await self._query(entry_name, start, stop, ttl, **kwargs)
 
-        last = False
-        method = "HEAD" if kwargs.pop("head", False) else "GET"
-
-        while not last:
-            async with self._http.request(
-                method, f"/b/{self.name}/{entry_name}/batch?q={query_id}"
-            ) as resp:
-                if resp.status == 204:
-                    return
-                async for record in parse_batched_records(resp):
-                    last = record.last
-                    yield record
-
-    async def get_full_info(self) -> BucketFullInfo:
+        url = f"{self._path}/{entry_name}/batch?q={query_id}"
+
+        # request the next batch while the records of the current one are consumed,
+        # unless the time spent on them would count against its timeout
+        timeout = self._http.timeout
+        prefetch = timeout.total is None and timeout.sock_read is None
+        next_batch = asyncio.ensure_future(self._open_batch(method, url))
+        try:
+            while next_batch is not None:
+                stack, resp = await next_batch
+                next_batch = None
+                try:
+                    if resp.status == 204:
+                        return
+                    last = resp.headers.get("x-reduct-last", "false") == "true"
+                    if prefetch and not last:
+                        next_batch = asyncio.ensure_future(
+                            self._open_batch(method, url)
+                        )
+                    async for record in parse_batched_records(resp):
+                        yield record
+                finally:
+                    await stack.aclose()
+                if not prefetch and not last:
+                    next_batch = asyncio.ensure_future(self._open_batch(method, url))
+        finally:
+            if next_batch is not None:
+                await self._close_batch(next_batch)
+
+    async def get_full_info(self, force: bool = False) -> BucketFullInfo:
         """
         Get full information about bucket (settings, statistics, entries)
+        The information is cached for 1 second and reset by changes
+        made through this object.
 
+        Args:
+            force: if True: ignore the cache and request the information
         Returns:
             BucketFullInfo: the full information about the bucket
         """
-        body, _ = await self._http.request_all("GET", f"/b/{self.name}")
+        now = time.monotonic()
+        if not force and self._full_info is not None:
+            cached_at, body = self._full_info
+            if now - cached_at < _FULL_INFO_TTL:
+                return BucketFullInfo.model_validate_json(body)
+
+        generation = self._generation
+        body, _ = await self._http.request_all("GET", self._path)
+        if generation == self._generation:
+            self._full_info = (now, body)
         return BucketFullInfo.model_validate_json(body)
 
+    def _reset_full_info(self):
+        self._generation += 1
+        self._full_info = None
+
+    @contextmanager
+    def _changing(self):
+        """Reset the cached full info after a change, even a failed one"""
+        try:
+            yield
+        finally:
+            self._reset_full_info()
+
     async def subscribe(
         self,
         entry_name: str,
@@ -490,7 +578,9 @@ class Bucket:
             entry_name: name of entry in the bucket
             start: the beginning timestamp to read records.
                 If None, then from the first record.
-            poll_interval: inteval to ask new records in seconds
+            poll_interval: maximal interval to ask new records in seconds.
+                The client polls more often right after it has received records
+                or when the bucket is notified with `notify()`
             when: condtion to filter records
         Keyword Args:
             include (dict): query records which have all labels
@@ -506,15 +596,12 @@ class Bucket:
             >>> async for record in bucket.subscribes("entry-1"):
             >>>     data: bytes = record.read_all()
             >>>     # or
-            >>>     async for chunk in record.read(n=1024):
+            >>>     async for chunk in record.read():
             >>>         print(chunk)
         """
         ttl = poll_interval * 2 + 1
-        if (
-            self._http.api_version
-            and self._http.api_version[0] == 1
-            and self._http.api_version[1] >= 13
-        ):
+        method = "HEAD" if kwargs.pop("head", False) else "GET"
+        if self._http.supports_query_post:
             query_id = await self._query_post(
                 entry_name,
                 QueryType.QUERY,
@@ -530,39 +617,69 @@ class Bucket:
                 entry_name, start, None, ttl, continuous=True, **kwargs
             )
 
-        method = "HEAD" if kwargs.pop("head", False) else "GET"
-
-        while True:
-            async with self._http.request(
-                method, f"/b/{self.name}/{entry_name}/batch?q={query_id}"
-            ) as resp:
-                if resp.status == 204:
-                    await asyncio.sleep(poll_interval)
+        url = f"{self._path}/{entry_name}/batch?q={query_id}"
+
+        # poll quickly after new records and back off up to poll_interval when idle
+        delay = min(_MIN_POLL_INTERVAL, poll_interval)
+        wakeup = asyncio.Event()
+        self._wakeups.add(wakeup)
+        try:
+            while True:
+                async with self._http.request(
+                    method, url, read_bufsize=_BATCH_READ_BUFSIZE
+                ) as resp:
+                    if resp.status == 204:
+                        empty = True
+                    else:
+                        empty = False
+                        async for record in parse_batched_records(resp):
+                            yield record
+
+                if not empty:
+                    delay = min(_MIN_POLL_INTERVAL, poll_interval)
                     continue
 
-                async for record in parse_batched_records(resp):
-                    yield record
+                try:
+                    await asyncio.wait_for(wakeup.wait(), delay)
+                except asyncio.TimeoutError:
+                    delay = min(delay * 2, poll_interval)
+                else:
+                    wakeup.clear()
+                    delay = min(_MIN_POLL_INTERVAL, poll_interval)
+        finally:
+            self._wakeups.discard(wakeup)
+
+    def notify(self):
+        """
+        Wake up the subscriptions of the bucket to ask for new records
+        without waiting for the poll interval. Call it when the application
+        knows that new records have been written, e.g. by another client.
+        Only subscriptions made through this Bucket object are woken up.
+        """
+        for wakeup in self._wakeups:
+            wakeup.set()
 
     async def _query(self, entry_name, start, stop, ttl, **kwargs):
-        params = await self._parse_query_params(kwargs, start, stop)
+        params = self._parse_query_params(kwargs, start, stop)
 
-        if "limit" in kwargs:
-            params["limit"] = kwargs["limit"]
+        limit = kwargs.get("limit")
+        if limit is not None:
+            params["limit"] = limit
 
         if ttl:
             params["ttl"] = int(ttl)
 
-        if "continuous" in kwargs:
-            params["continuous"] = "true" if kwargs["continuous"] else "false"
+        continuous = kwargs.get("continuous")
+        if continuous is not None:
+            params["continuous"] = "true" if continuous else "false"
 
-        url = f"/b/{self.name}/{entry_name}"
+        url = f"{self._path}/{entry_name}"
         data, _ = await self._http.request_all(
             "GET",
             f"{url}/q",
             params=params,
         )
-        query_id = json.loads(data)["id"]
-        return query_id
+        return QueryInfo.model_validate_json(data).id
 
     async def _query_post(  # pylint: disable=too-many-positional-arguments, too-many-arguments
         self, entry_name, query_type: QueryType, start, stop, when, ttl, **kwargs
@@ -573,16 +690,16 @@ class Bucket:
             query_type=query_type, start=start, stop=stop, when=when, ttl=ttl, **kwargs
         )
         data = query_message.model_dump_json()
-        url = f"/b/{self.name}/{entry_name}/q"
+        url = f"{self._path}/{entry_name}/q"
         data, _ = await self._http.request_all(
             "POST",
             url,
             data=data,
         )
-        query_id = json.loads(data)["id"]
-        return query_id
+        return QueryInfo.model_validate_json(data).id
 
-    async def _parse_query_params(self, kwargs, start, stop):
+    @staticmethod
+    def _parse_query_params(kwargs, start, stop):
         start = unix_timestamp_from_any(start) if start else None
         stop = unix_timestamp_from_any(stop) if stop else None
         params = {}
@@ -590,18 +707,60 @@ class Bucket:
             params["start"] = start
         if stop:
             params["stop"] = stop
-        if "include" in kwargs:
-            for name, value in kwargs["include"].items():
+        include = kwargs.get("include")
+        if include:
+            for name, value in include.items():
                 params[f"include-{name}"] = str(value)
-        if "exclude" in kwargs:
-            for name, value in kwargs["exclude"].items():
+        exclude = kwargs.get("exclude")
+        if exclude:
+            for name, value in exclude.items():
                 params[f"exclude-{name}"] = str(value)
-        if "each_s" in kwargs:
-            params["each_s"] = float(kwargs["each_s"])
-        if "each_n" in kwargs:
-            params["each_n"] = int(kwargs["each_n"])
+        each_s = kwargs.get("each_s")
+        if each_s is not None:
+            params["each_s"] = float(each_s)
+        each_n = kwargs.get("each_n")
+        if each_n is not None:
+            params["each_n"] = int(each_n)
         return params
 
+    async def _open_batch(
+        self, method: str, url: str
+    ) -> Tuple[AsyncExitStack, ClientResponse]:
+        """Send request for a batch of records and keep its response open"""
+        stack = AsyncExitStack()
+        resp = await stack.enter_async_context(
+            self._http.request(method, url, read_bufsize=_BATCH_READ_BUFSIZE)
+        )
+        return stack, resp
+
+    @staticmethod
+    async def _close_batch(batch: asyncio.Future):
+        """Cancel a prefetched batch or release its response if it is received"""
+        if not batch.done():
+            batch.cancel()
+        elif not batch.cancelled() and batch.exception() is None:
+            stack, _ = batch.result()
+            await stack.aclose()
+
+    async def _batch_request(
+        self,
+        method: str,
+        entry_name: str,
+        batch: Batch,
+        data: Optional[Union[bytes, AsyncIterator[bytes]]] = None,
+    ) -> Dict[int, ReductError]:
+        """Send batch with records in headers and parse errors"""
+        content_length, record_headers = self._make_headers(batch)
+        with self._changing():
+            _, headers = await self._http.request_all(
+                method,
+                f"{self._path}/{entry_name}/batch",
+                data=data,
+                extra_headers=record_headers,
+                content_length=content_length if data is not None else 0,
+            )
+        return self._parse_errors_from_headers(headers)
+
     @staticmethod
     def _make_headers(batch: Batch) -> Tuple[int, Dict[str, str]]:
         """Make headers for batch"""
@@ -609,22 +768,22 @@ class Bucket:
         content_length = 0
         for time_stamp, record in batch.items():
             content_length += record.size
-            header = f"{record.size},{record.content_type}"
+            header = [str(record.size), record.content_type]
             for label, value in record.labels.items():
                 if "," in label or "=" in label:
-                    header += f',{label}="{value}"'
+                    header.append(f'{label}="{value}"')
                 else:
-                    header += f",{label}={value}"
+                    header.append(f"{label}={value}")
 
-            record_headers[f"{TIME_PREFIX}{time_stamp}"] = header
+            record_headers[f"{TIME_PREFIX}{time_stamp}"] = ",".join(header)
 
         record_headers["Content-Type"] = "application/octet-stream"
         return content_length, record_headers
 
     @staticmethod
     def _parse_errors_from_headers(headers):
-        errors = {}
-        for key, value in headers.items():
-            if key.startswith(ERROR_PREFIX):
-                errors[int(key[len(ERROR_PREFIX) :])] = ReductError.from_header(value)
-        return errors
+        return {
+            int(key[_ERROR_PREFIX_LEN:]): ReductError.from_header(value)
+            for key, value in headers.items()
+            if key.startswith(ERROR_PREFIX)
+        }
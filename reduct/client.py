@@ -1,8 +1,9 @@
 """Client module for ReductStore HTTP API"""
 
-from typing import Optional, List, Dict
+import asyncio
+from typing import Optional, List, Dict, Callable, Awaitable, TypeVar
 
-from aiohttp import ClientSession
+from aiohttp import ClientSession, TCPConnector
 
 from reduct.bucket import BucketInfo, BucketSettings, Bucket
 from reduct.error import ReductError
@@ -22,6 +23,30 @@ from reduct.msg.token import (
     Permissions,
 )
 
+KEEPALIVE_TIMEOUT = 60
+DNS_CACHE_TTL = 300
+CONNECTION_LIMIT = 100
+
+_T = TypeVar("_T")
+
+
+def _check_concurrency(concurrency: int):
+    if concurrency < 1:
+        raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+
+
+async def _gather_by_name(
+    func: Callable[[str], Awaitable[_T]], names: List[str], concurrency: int
+) -> List[_T]:
+    """Call func for each name concurrently and keep the order of names"""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def call(name: str) -> _T:
+        async with semaphore:
+            return await func(name)
+
+    return list(await asyncio.gather(*(call(name) for name in names)))
+
 
 class Client:
     """HTTP Client for Reduct Storage HTTP API"""
@@ -45,16 +70,38 @@ class Client:
         Kwargs:
             session: an external aiohttp session to use for requests
             verify_ssl: verify SSL certificates
+            keepalive_timeout: seconds to keep idle connections open
+                in the context manager (default: 60)
+            connection_limit: maximal number of simultaneous connections
+                in the context manager (default: 100)
+        Note:
+            Without a session, each request opens and closes its own connection.
+            Use the client as an async context manager or pass a session
+            to reuse connections with keep-alive.
         Examples:
             >>> client = Client("http://127.0.0.1:8383")
             >>> info = await client.info()
+            >>>
+            >>> async with Client("http://127.0.0.1:8383") as client:
+            >>>     info = await client.info()
         """
+        self._keepalive_timeout = kwargs.pop("keepalive_timeout", KEEPALIVE_TIMEOUT)
+        self._connection_limit = kwargs.pop("connection_limit", CONNECTION_LIMIT)
         self._http = HttpClient(
             url.rstrip("/"), api_token, timeout, extra_headers, **kwargs
         )
 
     async def __aenter__(self):
-        self._http._session = ClientSession(timeout=self._http._timeout)
+        # keep idle connections and resolved addresses longer than aiohttp does
+        # by default, so that polling and periodic writes reuse the connection
+        connector = TCPConnector(
+            limit=self._connection_limit,
+            keepalive_timeout=self._keepalive_timeout,
+            ttl_dns_cache=DNS_CACHE_TTL,
+        )
+        self._http._session = ClientSession(
+            timeout=self._http._timeout, connector=connector
+        )
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -150,6 +197,24 @@ class Client:
         body, _ = await self._http.request_all("GET", f"/tokens/{name}")
         return FullTokenInfo.model_validate_json(body)
 
+    async def get_all_tokens(self, concurrency: int = 16) -> List[FullTokenInfo]:
+        """
+        Get all tokens with their permissions
+        Args:
+            concurrency: maximal number of simultaneous requests
+        Returns:
+            List[FullTokenInfo]: the information about each token
+                in the order of the token list
+        Raises:
+            ReductError: if there is an HTTP error
+            ValueError: if concurrency is less than 1
+        """
+        _check_concurrency(concurrency)
+        tokens = await self.get_token_list()
+        return await _gather_by_name(
+            self.get_token, [token.name for token in tokens], concurrency
+        )
+
     async def create_token(self, name: str, permissions: Permissions) -> str:
         """
         Create a new token
@@ -215,6 +280,28 @@ class Client:
         )
         return ReplicationDetailInfo.model_validate_json(body)
 
+    async def get_all_replication_details(
+        self, concurrency: int = 16
+    ) -> List[ReplicationDetailInfo]:
+        """
+        Get detailed information about all replications
+        Args:
+            concurrency: maximal number of simultaneous requests
+        Returns:
+            List[ReplicationDetailInfo]: the detailed information about each
+                replication in the order of the replication list
+        Raises:
+            ReductError: if there is an HTTP error
+            ValueError: if concurrency is less than 1
+        """
+        _check_concurrency(concurrency)
+        replications = await self.get_replications()
+        return await _gather_by_name(
+            self.get_replication_detail,
+            [replication.name for replication in replications],
+            concurrency,
+        )
+
     async def create_replication(
         self, replication_name: str, settings: ReplicationSettings
     ) -> None:
@@ -100,7 +100,7 @@ class HttpClient:
                 **kwargs,
             ) as response:
                 if self._api_version is None:
-                    self._api_version = response.headers.get("x-reduct-api")
+                    self._set_api_version(response.headers.get("x-reduct-api"))
 
                 if response.ok:
                     yield response
@@ -144,12 +144,27 @@ class HttpClient:
                 yield chunk
         return
 
+    def _set_api_version(self, version: Optional[str]):
+        if version is not None:
+            self._api_version = extract_api_version(version)
+
     @property
     def api_version(self) -> Optional[Tuple[int, int]]:
         """API version"""
-        if self._api_version is None:
-            return None
-        return extract_api_version(self._api_version)
+        return self._api_version
+
+    @property
+    def timeout(self) -> ClientTimeout:
+        """Timeout of requests, taken from the external session if there is one"""
+        if self._session is not None:
+            return self._session.timeout
+        return self._timeout
+
+    @property
+    def supports_query_post(self) -> bool:
+        """Server supports queries with JSON body (API v1.13 and higher)"""
+        version = self._api_version
+        return version is not None and version[0] == 1 and version[1] >= 13
 
 
 def extract_api_version(version: str) -> Tuple[int, int]:
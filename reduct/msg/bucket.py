@@ -6,7 +6,7 @@ from typing import Optional, List, Dict
 from pydantic import BaseModel, Field
 
 
-class QuotaType(Enum):
+class QuotaType(str, Enum):
     """determines if database has a fixed size"""
 
     NONE = "NONE"
@@ -87,7 +87,21 @@ class BucketFullInfo(BaseModel):
     """information about entries of bucket"""
 
 
-class QueryType(Enum):
+class QueryInfo(BaseModel):
+    """Response of a query request"""
+
+    id: int
+    """id of the query to fetch records"""
+
+
+class RemoveQueryInfo(BaseModel):
+    """Response of a remove query request"""
+
+    removed_records: int
+    """number of removed records"""
+
+
+class QueryType(str, Enum):
     """Query types"""
 
     QUERY = "QUERY"
@@ -1,6 +1,7 @@
 """Record module"""
 
 import asyncio
+import sys
 import time
 from dataclasses import dataclass
 from datetime import datetime
@@ -22,9 +23,21 @@ from reduct.time import unix_timestamp_to_datetime, unix_timestamp_from_any
 
 
 @dataclass
-class Record:
+class Record:  # pylint: disable=too-many-instance-attributes
     """Record in a query"""
 
+    # queries create many records, so they have no instance dict
+    __slots__ = (
+        "timestamp",
+        "size",
+        "last",
+        "content_type",
+        "read_all",
+        "read",
+        "labels",
+        "_datetime",
+    )
+
     timestamp: int
     """UNIX timestamp in microseconds"""
     size: int
@@ -36,17 +49,49 @@ class Record:
     read_all: Callable[[None], Awaitable[bytes]]
     """read all data"""
     read: Callable[[int], AsyncIterator[bytes]]
-    """read data in chunks where each chunk has size less than or equal to n"""
+    """read data in chunks where each chunk has size less than or equal to n
+    (default: CHUNK_SIZE)"""
 
     labels: Dict[str, str]
     """labels of record"""
 
+    def __post_init__(self):
+        self._datetime: Optional[datetime] = None
+
     def get_datetime(self) -> datetime:
         """Get timestamp of record as datetime
         Returns:
             datetime: timestamp as datetime
         """
-        return unix_timestamp_to_datetime(self.timestamp)
+        if self._datetime is None:
+            self._datetime = unix_timestamp_to_datetime(self.timestamp)
+        return self._datetime
+
+    async def read_into(self, buffer, n: int = 0) -> int:
+        """Read data into a pre-allocated buffer without extra copies
+        Args:
+            buffer: writable object supporting the buffer protocol
+                (bytearray, memoryview, mmap, numpy array etc.)
+            n: size of chunks to read (default: CHUNK_SIZE)
+        Returns:
+            int: number of bytes written into the buffer
+        Raises:
+            ValueError: if the buffer is smaller than the record
+        Examples:
+            >>> buffer = bytearray(record.size)
+            >>> await record.read_into(buffer)
+        """
+        view = memoryview(buffer).cast("B")
+        if len(view) < self.size:
+            raise ValueError(
+                f"Buffer size {len(view)} is less than record size {self.size}"
+            )
+
+        offset = 0
+        async for chunk in self.read(n if n > 0 else CHUNK_SIZE):
+            view[offset : offset + len(chunk)] = chunk
+            offset += len(chunk)
+        return offset
 
 
 class Batch:
@@ -54,6 +99,7 @@ class Batch:
 
     def __init__(self):
         self._records: Dict[int, Record] = {}
+        self._sorted_items: Optional[List[Tuple[int, Record]]] = None
         self._total_size = 0
         self._last_access = 0
 
@@ -80,7 +126,7 @@ class Batch:
 
         rec_offset = 0
 
-        async def read(n: int) -> AsyncIterator[bytes]:
+        async def read(n: int = CHUNK_SIZE) -> AsyncIterator[bytes]:
             nonlocal rec_offset
             while rec_offset < len(data):
                 chunk = data[rec_offset : rec_offset + n]
@@ -103,10 +149,14 @@ class Batch:
         self._total_size += record.size
         self._last_access = time.time()
         self._records[record.timestamp] = record
+        self._sorted_items = None
 
     def items(self) -> List[Tuple[int, Record]]:
-        """Get records as dict items"""
-        return sorted(self._records.items())
+        """Get records as dict items sorted by timestamp.
+        The list is cached until the batch is changed, so don't modify it"""
+        if self._sorted_items is None:
+            self._sorted_items = sorted(self._records.items())
+        return self._sorted_items
 
     @property
     def size(self) -> int:
@@ -121,6 +171,7 @@ class Batch:
     def clear(self):
         """Clear batch"""
         self._records.clear()
+        self._sorted_items = None
         self._total_size = 0
         self._last_access = 0
 
@@ -131,31 +182,38 @@ class Batch:
 LABEL_PREFIX = "x-reduct-label-"
 TIME_PREFIX = "x-reduct-time-"
 ERROR_PREFIX = "x-reduct-error-"
-CHUNK_SIZE = 16_000
+CHUNK_SIZE = 64 * 1024
+
+_LABEL_PREFIX_LEN = len(LABEL_PREFIX)
+_TIME_PREFIX_LEN = len(TIME_PREFIX)
 
 
 def parse_record(resp: ClientResponse, last=True) -> Record:
     """Parse record from response"""
-    timestamp = int(resp.headers["x-reduct-time"])
-    size = int(resp.headers["content-length"])
-    content_type = resp.headers.get("content-type", "application/octet-stream")
-    labels = dict(
-        (name[len(LABEL_PREFIX) :], value)
-        for name, value in resp.headers.items()
-        if name.startswith(LABEL_PREFIX)
-    )
+    headers = resp.headers
+    timestamp = int(headers["x-reduct-time"])
+    size = int(headers["content-length"])
+    content_type = sys.intern(headers.get("content-type", "application/octet-stream"))
+    labels = {}
+    for name, value in headers.items():
+        if name.startswith(LABEL_PREFIX):
+            labels[sys.intern(name[_LABEL_PREFIX_LEN:])] = value
 
     return Record(
         timestamp=timestamp,
         size=size,
         last=last,
         read_all=resp.read,
-        read=resp.content.iter_chunked,
+        read=partial(_iter_chunked, resp),
         labels=labels,
         content_type=content_type,
     )
 
 
+def _iter_chunked(resp: ClientResponse, n: int = CHUNK_SIZE) -> AsyncIterator[bytes]:
+    return resp.content.iter_chunked(n)
+
+
 def _parse_header_as_csv_row(row: str) -> (int, str, Dict[str, str]):
     items = []
     escaped = ""
@@ -173,18 +231,19 @@ def _parse_header_as_csv_row(row: str) -> (int, str, Dict[str, str]):
             items.append(item)
 
     content_length = int(items[0])
-    content_type = items[1]
+    # the same content types and label names repeat in every record of a query
+    content_type = sys.intern(items[1])
 
     labels = {}
     for label in items[2:]:
         if "=" in label:
             name, value = label.split("=", 1)
-            labels[name] = value
+            labels[sys.intern(name)] = value
 
     return content_length, content_type, labels
 
 
-async def _read(buffer: List[bytes], n: int) -> AsyncIterator[bytes]:
+async def _read(buffer: List[bytes], n: int = CHUNK_SIZE) -> AsyncIterator[bytes]:
     while len(buffer) > 0:
         part = buffer.pop(0)
         if len(part) == 0:
@@ -215,7 +274,7 @@ async def parse_batched_records(resp: ClientResponse) -> AsyncIterator[Record]:
 
     for name, value in resp.headers.items():
         if name.startswith(TIME_PREFIX):
-            timestamp = int(name[14:])
+            timestamp = int(name[_TIME_PREFIX_LEN:])
             content_length, content_type, labels = _parse_header_as_csv_row(value)
 
             last = False
@@ -223,7 +282,7 @@ async def parse_batched_records(resp: ClientResponse) -> AsyncIterator[Record]:
 
             if records_count == records_total:
                 # last record in batched records read in client code
-                read_func = resp.content.iter_chunked
+                read_func = partial(_iter_chunked, resp)
                 read_all_func = resp.read
                 if resp.headers.get("x-reduct-last", "false") == "true":
                     # last record in query
@@ -254,12 +313,5 @@ async def parse_batched_records(resp: ClientResponse) -> AsyncIterator[Record]:
 
 
 async def _read_response(resp, content_length) -> List[bytes]:
-    chunks = []
-    count = 0
-    while count < content_length:
-        n = min(CHUNK_SIZE, content_length - count)
-        chunk = await resp.content.read(n)
-        chunks.append(chunk)
-        count += len(chunk)
-
-    return chunks
+    # one exact read gives one bytes object per record instead of a list of chunks
+    return [await resp.content.readexactly(content_length)]
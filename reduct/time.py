@@ -14,6 +14,9 @@ def unix_timestamp_from_any(timestamp: Union[int, datetime, float, str]) -> int:
     Returns:
         int: UNIX timestamp in microseconds
     """
+    if isinstance(timestamp, int):
+        # the most common case, check it first
+        return int(timestamp)
     if isinstance(timestamp, datetime):
         return int(timestamp.timestamp() * TIME_PRECISION)
     if isinstance(timestamp, str):
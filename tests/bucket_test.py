@@ -2,6 +2,7 @@
 
 import asyncio
 import time
+from array import array
 from datetime import datetime
 
 from typing import List, Tuple
@@ -9,7 +10,7 @@ from typing import List, Tuple
 import pytest
 
 from reduct import ReductError, BucketSettings, QuotaType, Record, BucketFullInfo
-from reduct.record import Batch
+from reduct.record import Batch, CHUNK_SIZE
 from tests.conftest import requires_api
 
 
@@ -75,6 +76,26 @@ async def test__get_full_info(bucket_2):
     assert info.entries == await bucket_2.get_entry_list()
 
 
+@pytest.mark.asyncio
+async def test__get_info_after_write(bucket_2):
+    """Should not return cached info after writing"""
+    info = await bucket_2.info()
+    await bucket_2.write("entry-1", b"some-data", timestamp=7_000_000)
+    assert (await bucket_2.info()).latest_record == 7000000
+    assert (await bucket_2.get_full_info(force=True)).info.size > info.size
+
+
+@pytest.mark.asyncio
+async def test__get_cached_info_copies(bucket_1):
+    """Should give out fresh copies of cached info"""
+    entries = await bucket_1.get_entry_list()
+    entries.clear()
+    settings = await bucket_1.get_settings()
+    settings.quota_size = 1
+    assert len(await bucket_1.get_entry_list()) == 2
+    assert (await bucket_1.get_settings()).quota_size != 1
+
+
 @pytest.mark.asyncio
 async def test__get_entries(bucket_1):
     """Should get list of entries"""
@@ -136,6 +157,15 @@ async def test__write_by_timestamp(bucket_2, timestamp):
         assert data == b"test-data"
 
 
+@pytest.mark.asyncio
+async def test__read_zero_timestamp(bucket_2):
+    """Should read a record at timestamp 0 and not the latest one"""
+    await bucket_2.write("entry-1", b"zero", timestamp=0)
+    async with bucket_2.read("entry-1", timestamp=0) as record:
+        assert record.timestamp == 0
+        assert await record.read_all() == b"zero"
+
+
 @pytest.mark.asyncio
 async def test__write_with_current_time(bucket_2):
     """Should write a record with current time"""
@@ -163,6 +193,34 @@ async def test__write_in_chunks(bucket_2):
         assert data == b"part1part2"
 
 
+@pytest.mark.asyncio
+async def test__write_in_chunks_without_size(bucket_2):
+    """Should require content length to write an iterator"""
+
+    async def sender():
+        yield b"part1"
+
+    with pytest.raises(ValueError):
+        await bucket_2.write("entry-1", sender())
+
+
+@pytest.mark.asyncio
+async def test__write_memoryview(bucket_2):
+    """Should write any contiguous memory and count its size in bytes"""
+    data = array("i", [1, 2, 3])
+    await bucket_2.write("entry-1", memoryview(data))
+    async with bucket_2.read("entry-1") as record:
+        assert record.size == 12
+        assert await record.read_all() == data.tobytes()
+
+
+@pytest.mark.asyncio
+async def test__write_non_contiguous_memoryview(bucket_2):
+    """Should raise an error if memoryview isn't C-contiguous"""
+    with pytest.raises(ValueError, match="memoryview must be C-contiguous"):
+        await bucket_2.write("entry-1", memoryview(b"some-data")[::2])
+
+
 @pytest.mark.asyncio
 async def test__write_with_labels(bucket_1):
     """Should write data with labels"""
@@ -269,6 +327,25 @@ async def test_query_records_all(bucket_1):
     assert len(records) == 3
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("delay", [0, 0.1])
+async def test_query_records_stop_early(bucket_1, delay):
+    """Should release prefetched batches when a query is stopped early"""
+    batch = Batch()
+    for i in range(500):
+        batch.add(10_000_000 + i, b"some-data")
+    await bucket_1.write_batch("entry-3", batch)
+
+    records = bucket_1.query("entry-3")
+    async for _ in records:
+        await asyncio.sleep(delay)
+        break
+    await records.aclose()
+
+    records = [record async for record in bucket_1.query("entry-3")]
+    assert len(records) == 500
+
+
 @pytest.mark.asyncio
 async def test_read_record_in_chunks(bucket_1):
     """Should provide records with read method and read in chunks"""
@@ -309,6 +386,44 @@ async def test_read_record_in_chunks_full(bucket_1, size):
     assert data == blob
 
 
+@pytest.mark.asyncio
+async def test_read_record_in_default_chunks(bucket_1):
+    """Should read records in chunks of CHUNK_SIZE by default"""
+    blob = b"1" * (CHUNK_SIZE * 2 + 1)
+    await bucket_1.write("entry-5", blob, timestamp=1)
+
+    async with bucket_1.read("entry-5", timestamp=1) as record:
+        chunks = [chunk async for chunk in record.read()]
+
+    assert b"".join(chunks) == blob
+    assert all(len(chunk) <= CHUNK_SIZE for chunk in chunks)
+
+
+@pytest.mark.asyncio
+async def test_read_record_into_buffer(bucket_1):
+    """Should read records into a pre-allocated buffer"""
+    async with bucket_1.read("entry-2", timestamp=3_000_000) as record:
+        buffer = bytearray(record.size)
+        assert await record.read_into(buffer) == 11
+        assert buffer == b"some-data-3"
+
+    data = []
+    async for record in bucket_1.query("entry-2"):
+        buffer = bytearray(record.size)
+        await record.read_into(buffer, n=4)
+        data.append(bytes(buffer))
+
+    assert data == [b"some-data-3", b"some-data-4", b"some-data-5"]
+
+
+@pytest.mark.asyncio
+async def test_read_record_into_small_buffer(bucket_1):
+    """Should raise an error if the buffer is too small"""
+    async with bucket_1.read("entry-2", timestamp=3_000_000) as record:
+        with pytest.raises(ValueError, match="less than record size"):
+            await record.read_into(bytearray(5))
+
+
 @pytest.mark.asyncio
 async def test_no_content_query(bucket_1):
     """Should return empty list if no content"""
@@ -337,6 +452,27 @@ async def test_subscribe(bucket_1):
     assert data == [b"some-data-3", b"some-data-4", b"some-data-5", b"some-data-6"]
 
 
+@pytest.mark.asyncio
+async def test_subscribe_notify(bucket_1):
+    """Should wake up all subscriptions without waiting for the poll interval"""
+
+    async def subscriber():
+        async for record in bucket_1.subscribe(
+            "entry-2", start=6_000_000, poll_interval=10
+        ):
+            return await record.read_all()
+
+    async def writer():
+        await asyncio.sleep(1.5)
+        await bucket_1.write("entry-2", b"some-data-7", timestamp=7_000_000)
+        bucket_1.notify()
+
+    data_1, data_2, _ = await asyncio.wait_for(
+        asyncio.gather(subscriber(), subscriber(), writer()), 2.2
+    )
+    assert data_1 == data_2 == b"some-data-7"
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize("size", [1, 100, 10_000, 1_000_000])
 async def test_read_batched_records_in_random_order(bucket_1, size):
@@ -232,6 +232,28 @@ async def test__list_tokens(client, with_token):
     assert tokens[1].created_at is not None
 
 
+@requires_env("RS_API_TOKEN")
+@pytest.mark.usefixtures("bucket_1", "bucket_2")
+@pytest.mark.asyncio
+async def test__get_all_tokens(client, with_token):
+    """Should get all tokens with permissions"""
+    tokens = await client.get_all_tokens()
+    assert len(tokens) == 2
+    assert tokens[1].name == with_token
+    assert tokens[1].permissions.full_access
+
+
+@pytest.mark.asyncio
+async def test__get_all_with_bad_concurrency():
+    """Should raise an error before any request if concurrency is less than 1"""
+    client = Client("http://127.0.0.1:65535")
+
+    with pytest.raises(ValueError, match="concurrency must be at least 1, got 0"):
+        await client.get_all_tokens(concurrency=0)
+    with pytest.raises(ValueError, match="concurrency must be at least 1, got -1"):
+        await client.get_all_replication_details(concurrency=-1)
+
+
 @requires_env("RS_API_TOKEN")
 @pytest.mark.usefixtures("bucket_1", "bucket_2")
 @pytest.mark.asyncio
@@ -263,3 +285,13 @@ async def test__with(url, api_token):
     async with Client(url, api_token=api_token) as client:
         bucket = await client.create_bucket("bucket-1", exist_ok=True)
         await bucket.info()
+
+
+@pytest.mark.asyncio
+async def test__with_connection_settings(url, api_token):
+    """Should create a client with custom connection pool settings"""
+    async with Client(
+        url, api_token=api_token, keepalive_timeout=5, connection_limit=4
+    ) as client:
+        bucket = await client.create_bucket("bucket-1", exist_ok=True)
+        await bucket.info()
@@ -30,6 +30,17 @@ async def test__get_replication_detail(client, replication_1):
     assert replication_detail.info.name == replication_1
 
 
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("bucket_1", "bucket_2")
+async def test__get_all_replication_details(client, replication_1, replication_2):
+    """Test getting details of all replications"""
+    details = await client.get_all_replication_details(concurrency=1)
+    assert [detail.info.name for detail in details] == [
+        replication.name for replication in await client.get_replications()
+    ]
+    assert {replication_1, replication_2} <= {detail.info.name for detail in details}
+
+
 @pytest.mark.asyncio
 @pytest.mark.usefixtures("bucket_1", "bucket_2")
 async def test__update_replication(client, replication_1):